@@ -0,0 +1,139 @@
+"""Skip re-rendering part SVGs when nothing they depend on has changed.
+
+Each generated SVG gets a sidecar ``<name>.svg.hash`` file holding a key
+derived from the source of its generator and of config.py, and from the
+installed Boxes.py version. Delete the sidecar to force a re-render.
+
+The most recent renders are also kept under ``.cache/<stem>-<key>.svg``
+next to the output, so switching back to a recently built configuration
+copies the stored SVG instead of rendering it again. Older entries are
+evicted.
+"""
+
+import hashlib
+import os
+import shutil
+from importlib import metadata
+from io import BytesIO
+from pathlib import Path
+from typing import Callable
+
+from faxbox import config
+
+# Cached renders kept per output file
+CACHE_ENTRIES = 4
+
+# Bytes in a build key digest; keys are twice as many hex characters
+_DIGEST_SIZE = 16
+
+
+def _boxes_version() -> str:
+    """Installed Boxes.py version, or "" if it isn't installed."""
+    try:
+        return metadata.version("boxes")
+    except metadata.PackageNotFoundError:
+        return ""
+
+
+def build_key(generator_file: str) -> str:
+    """Key identifying a render by its inputs.
+
+    Covers the generator's and the config's source and the Boxes.py
+    version, since upgrading Boxes.py can change the rendered output.
+    """
+    digest = hashlib.blake2b(digest_size=_DIGEST_SIZE)
+    for source_file in (generator_file, config.__file__):
+        digest.update(Path(source_file).read_bytes())
+    digest.update(_boxes_version().encode())
+    return digest.hexdigest()
+
+
+def _hash_file(output_file: Path) -> Path:
+    """Sidecar file holding the build key for output_file."""
+    return output_file.with_name(output_file.name + ".hash")
+
+
+def _cached_file(output_file: Path, key: str) -> Path:
+    """Stored copy of output_file as rendered with the given key."""
+    return output_file.parent / ".cache" / f"{output_file.stem}-{key}{output_file.suffix}"
+
+
+def _evict(output_file: Path) -> None:
+    """Remove all but the CACHE_ENTRIES most recently used renders of output_file."""
+    key_pattern = "?" * (2 * _DIGEST_SIZE)  # build_key() hex digest
+    cached_files = sorted(
+        (output_file.parent / ".cache").glob(f"{output_file.stem}-{key_pattern}{output_file.suffix}"),
+        key=lambda path: path.stat().st_mtime_ns,
+        reverse=True,
+    )
+    for cached_file in cached_files[CACHE_ENTRIES:]:
+        cached_file.unlink()
+
+
+def is_up_to_date(output_file: Path, key: str) -> bool:
+    """Whether output_file exists and was rendered with the given key."""
+    hash_file = _hash_file(output_file)
+    return output_file.exists() and hash_file.exists() and hash_file.read_text() == key
+
+
+def restore_build(output_file: Path, key: str) -> bool:
+    """Make output_file current for key without rendering, if possible.
+
+    Returns:
+        True if output_file is up to date or was restored from the cache,
+        False if it needs to be rendered.
+    """
+    if is_up_to_date(output_file, key):
+        return True
+    cached_file = _cached_file(output_file, key)
+    if not cached_file.exists():
+        return False
+    shutil.copyfile(cached_file, output_file)
+    _hash_file(output_file).write_text(key)
+    # Mark the entry as recently used so eviction keeps it
+    os.utime(cached_file)
+    return True
+
+
+def record_build(output_file: Path, key: str) -> None:
+    """Record the key output_file was just rendered with and cache a copy."""
+    _hash_file(output_file).write_text(key)
+    if output_file.exists():
+        cached_file = _cached_file(output_file, key)
+        cached_file.parent.mkdir(exist_ok=True)
+        shutil.copyfile(output_file, cached_file)
+        _evict(output_file)
+
+
+def write_build(output_file: Path, data: BytesIO, key: str) -> None:
+    """Write rendered SVG data to output_file and record it under key."""
+    data.seek(0)
+    with open(output_file, "wb") as f:
+        shutil.copyfileobj(data, f, length=1 << 16)
+    record_build(output_file, key)
+
+
+def build_output(
+    output_file: Path,
+    generator_file: str,
+    render: Callable[[Path], BytesIO],
+    name: str,
+) -> bool:
+    """Render output_file with render() unless it is already current.
+
+    Args:
+        output_file: SVG file to produce.
+        generator_file: Source file of the generator (its ``__file__``).
+        render: Renders the SVG in memory for output_file.
+        name: Part name used in the "up to date" message.
+
+    Returns:
+        True if the SVG was rendered, False if it was up to date or restored
+        from the cache.
+    """
+    key = build_key(generator_file)
+    if restore_build(output_file, key):
+        print(f"{name} SVG up to date: {output_file.absolute()}")
+        return False
+    write_build(output_file, render(output_file), key)
+    return True
@@ -1,5 +1,38 @@
 """Configuration constants for fax machine box dimensions."""
 
+__all__ = [
+    "MATERIAL_THICKNESS",
+    "KERF",
+    "BURN",
+    "DEFAULT_BOX",
+    "OUTPUT_DIR",
+    "DRAWER_MATERIAL_THICKNESS",
+    "DRAWER",
+    "DRAWER_CLEARANCE",
+    "FINGER_NOTCH_RADIUS",
+    "SHELL",
+    "PAPER_COMPARTMENT_DEPTH",
+    "INTERNAL_WIDTH",
+    "INTERNAL_DEPTH",
+    "INTERNAL_HEIGHT",
+    "PAPER_WIDTH",
+    "DRAWER_BAY_WIDTH",
+    "LID_GROOVE_WIDTH",
+    "LID_GROOVE_DEPTH",
+    "LID_TAB_CLEARANCE",
+    "SLIDING_LID_TAB_DEPTH",
+    "FLAT_LID_TAB_WIDTH",
+    "FLAT_LID_TAB_DEPTH",
+    "ENGRAVE_COLOR",
+    "ENGRAVE_FONT_SIZE",
+    "ENGRAVE_FONT_SPACING",
+    "ENGRAVE_LINE_WIDTH",
+    "Config",
+    "CONFIG",
+]
+
+from dataclasses import dataclass
+
 # Material thickness in mm (3mm plywood is common for laser cutting)
 MATERIAL_THICKNESS = 3.0
 
@@ -54,6 +87,16 @@ SHELL = {
 # ~3" from front (76.2mm internal)
 PAPER_COMPARTMENT_DEPTH = 76.2  # 3" internal depth
 
+# Shell internal dimensions derived from the above (walls and divider are
+# DRAWER_MATERIAL_THICKNESS)
+INTERNAL_WIDTH = SHELL["width"] - 2 * DRAWER_MATERIAL_THICKNESS
+INTERNAL_DEPTH = SHELL["depth"] - 2 * DRAWER_MATERIAL_THICKNESS
+INTERNAL_HEIGHT = SHELL["height"] - 2 * DRAWER_MATERIAL_THICKNESS
+PAPER_WIDTH = PAPER_COMPARTMENT_DEPTH - DRAWER_MATERIAL_THICKNESS  # Account for divider
+# Span covered by the flat lid: from the paper compartment to the back wall,
+# including the divider (the drawer cavity itself is one thickness less)
+DRAWER_BAY_WIDTH = INTERNAL_WIDTH - PAPER_WIDTH - DRAWER_MATERIAL_THICKNESS
+
 # Lid groove dimensions for sliding lid
 LID_GROOVE_WIDTH = 3.5  # Slightly wider than material for sliding fit
 LID_GROOVE_DEPTH = 5.0  # How deep the groove cuts into the wall
@@ -71,3 +114,45 @@ ENGRAVE_COLOR = [1.0, 0.0, 0.0]  # Red RGB for Ponoko engraving (#FF0000)
 ENGRAVE_FONT_SIZE = 8.0  # Size of each pixel cell in mm
 ENGRAVE_FONT_SPACING = 2.0  # Space between letters in mm
 ENGRAVE_LINE_WIDTH = 0.5  # Line width for engraving strokes in mm
+
+
+@dataclass(frozen=True)
+class Config:
+    """Dimension constants bundled into one immutable object.
+
+    Lets callers such as the test fixtures import a single name instead of
+    each constant separately.
+    """
+
+    shell: dict
+    drawer: dict
+    material_thickness: float
+    drawer_material_thickness: float
+    drawer_clearance: float
+    paper_compartment_depth: float
+    internal_width: float
+    internal_depth: float
+    internal_height: float
+    drawer_bay_width: float
+    lid_groove_width: float
+    lid_groove_depth: float
+    lid_tab_clearance: float
+    sliding_lid_tab_depth: float
+
+
+CONFIG = Config(
+    shell=SHELL,
+    drawer=DRAWER,
+    material_thickness=MATERIAL_THICKNESS,
+    drawer_material_thickness=DRAWER_MATERIAL_THICKNESS,
+    drawer_clearance=DRAWER_CLEARANCE,
+    paper_compartment_depth=PAPER_COMPARTMENT_DEPTH,
+    internal_width=INTERNAL_WIDTH,
+    internal_depth=INTERNAL_DEPTH,
+    internal_height=INTERNAL_HEIGHT,
+    drawer_bay_width=DRAWER_BAY_WIDTH,
+    lid_groove_width=LID_GROOVE_WIDTH,
+    lid_groove_depth=LID_GROOVE_DEPTH,
+    lid_tab_clearance=LID_TAB_CLEARANCE,
+    sliding_lid_tab_depth=SLIDING_LID_TAB_DEPTH,
+)
@@ -1,10 +1,12 @@
 """Generate drawer boxes for the fax machine organizer."""
 
+from io import BytesIO
 from pathlib import Path
 
 from boxes import Boxes
 from boxes import edges
 
+from faxbox.build_cache import build_output
 from faxbox.config import (
     BURN,
     DRAWER,
@@ -95,17 +97,15 @@ class DrawerBox(Boxes):
         )
 
 
-def generate_drawer() -> Path:
-    """Generate a drawer box SVG file.
+def render_drawer(output_file: Path) -> BytesIO:
+    """Render the drawer box SVG in memory.
+
+    Args:
+        output_file: Output path recorded in the Boxes.py arguments.
 
     Returns:
-        Path to the generated SVG file.
+        The SVG data returned by Boxes.close().
     """
-    output_path = Path(OUTPUT_DIR)
-    output_path.mkdir(parents=True, exist_ok=True)
-
-    output_file = output_path / "drawer.svg"
-
     drawer = DrawerBox()
     drawer.parseArgs([
         "--output", str(output_file),
@@ -119,20 +119,24 @@ def generate_drawer() -> Path:
 
     drawer.open()
     drawer.render()
+    return drawer.close()
 
-    # Add finger notch hole to front wall
-    # Position it centered on the top edge of the front panel
-    # We need to use the hole feature of boxes.py
-    # The front wall should have a semicircular cutout at the top center
 
-    data = drawer.close()
+def generate_drawer() -> Path:
+    """Generate a drawer box SVG file.
 
-    with open(output_file, "wb") as f:
-        f.write(data.getvalue())
+    Returns:
+        Path to the generated SVG file.
+    """
+    output_path = Path(OUTPUT_DIR)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    output_file = output_path / "drawer.svg"
 
-    print(f"Generated drawer SVG: {output_file.absolute()}")
-    print(f"  Internal dimensions: {DRAWER['width']}mm × {DRAWER['depth']}mm × {DRAWER['height']}mm")
-    print(f"  Material thickness: {DRAWER_MATERIAL_THICKNESS}mm")
+    if build_output(output_file, __file__, render_drawer, "Drawer"):
+        print(f"Generated drawer SVG: {output_file.absolute()}")
+        print(f"  Internal dimensions: {DRAWER['width']}mm × {DRAWER['depth']}mm × {DRAWER['height']}mm")
+        print(f"  Material thickness: {DRAWER_MATERIAL_THICKNESS}mm")
     return output_file
 
 
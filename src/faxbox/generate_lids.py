@@ -5,19 +5,22 @@ Two lids:
 2. Flat tabbed lid for drawer bay - sits on top with alignment tabs
 """
 
+from io import BytesIO
 from pathlib import Path
 
 from boxes import Boxes
 from boxes import edges
 
+from faxbox.build_cache import build_output
 from faxbox.config import (
     BURN,
+    DRAWER_BAY_WIDTH,
     DRAWER_MATERIAL_THICKNESS,
+    INTERNAL_DEPTH,
     LID_GROOVE_DEPTH,
     LID_GROOVE_WIDTH,
     OUTPUT_DIR,
-    PAPER_COMPARTMENT_DEPTH,
-    SHELL,
+    PAPER_WIDTH,
 )
 
 
@@ -36,16 +39,6 @@ class LidGenerator(Boxes):
 
         t = self.thickness
 
-        # Calculate internal dimensions from external shell
-        internal_width = SHELL["width"] - 2 * t
-        internal_depth = SHELL["depth"] - 2 * t
-
-        # Paper compartment dimensions
-        paper_width = PAPER_COMPARTMENT_DEPTH - t  # Account for divider
-
-        # Drawer bay dimensions
-        drawer_bay_width = internal_width - paper_width - t
-
         # === SLIDING LID (Paper Compartment) ===
         # Slides front-to-back in grooves on side walls
         # Width: paper compartment width minus clearance for groove fit
@@ -53,63 +46,34 @@ class LidGenerator(Boxes):
 
         # Lid tabs fit in grooves: width = LID_GROOVE_WIDTH with clearance
         lid_clearance = 0.5  # mm clearance for smooth sliding
-        sliding_lid_width = paper_width - lid_clearance
-        sliding_lid_depth = internal_depth - lid_clearance
+        sliding_lid_width = PAPER_WIDTH - lid_clearance
+        sliding_lid_depth = INTERNAL_DEPTH - lid_clearance
 
         # Tab dimensions (extend into grooves)
         tab_depth = LID_GROOVE_DEPTH - 1  # Slightly less than groove depth
 
-        def add_sliding_lid_tabs():
-            """Add tabs on left and right edges for groove engagement."""
-            # Left tab (rectangular extension)
-            self.rectangularHole(
-                -tab_depth / 2,  # Extends past left edge
-                sliding_lid_depth / 2,  # Center along depth
-                tab_depth,
-                sliding_lid_depth - 2 * t,  # Leave clearance at ends
-                r=0
-            )
-            # Right tab
-            self.rectangularHole(
-                sliding_lid_width + tab_depth / 2,  # Extends past right edge
-                sliding_lid_depth / 2,
-                tab_depth,
-                sliding_lid_depth - 2 * t,
-                r=0
-            )
-
-        # Main sliding lid panel
-        self.rectangularWall(
-            sliding_lid_width,
-            sliding_lid_depth,
-            "eeee",  # Plain edges - tabs added separately
-            move="right",
-            label="Sliding Lid (Paper)"
-        )
+        # Tabs run along both side edges, slightly shorter to clear the ends
+        tab_length = sliding_lid_depth - 4 * t
+        tab_offset = (sliding_lid_depth - tab_length) / 2
 
-        # Add separate tab pieces that attach to sliding lid edges
-        # Left tab strip
-        self.rectangularWall(
-            tab_depth,
-            sliding_lid_depth - 4 * t,  # Slightly shorter to clear ends
-            "eeee",
-            move="right",
-            label="Sliding Lid - Left Tab"
+        # Sliding lid panel with both tabs drawn as one continuous outline,
+        # counter-clockwise from the bottom-left corner of the panel
+        overall_width = sliding_lid_width + 2 * tab_depth
+        side_with_tab = (
+            tab_offset, -90, tab_depth, 90, tab_length, 90, tab_depth, -90, tab_offset, 90,
         )
-
-        # Right tab strip
-        self.rectangularWall(
-            tab_depth,
-            sliding_lid_depth - 4 * t,
-            "eeee",
-            move="up",
-            label="Sliding Lid - Right Tab"
+        self.move(overall_width, sliding_lid_depth, "up", before=True)
+        self.moveTo(tab_depth, 0)
+        self.polyline(
+            sliding_lid_width, 90, *side_with_tab,
+            sliding_lid_width, 90, *side_with_tab,
         )
+        self.move(overall_width, sliding_lid_depth, "up", label="Sliding Lid (Paper)")
 
         # === FLAT TABBED LID (Drawer Bay) ===
         # Sits on top of drawer bay, tabs slot into wall tops
-        flat_lid_width = drawer_bay_width - lid_clearance
-        flat_lid_depth = internal_depth - lid_clearance
+        flat_lid_width = DRAWER_BAY_WIDTH - lid_clearance
+        flat_lid_depth = INTERNAL_DEPTH - lid_clearance
 
         # Alignment tabs on underside (small rectangles at edges)
         tab_size = t  # Tabs are material-thickness sized
@@ -137,28 +101,29 @@ class LidGenerator(Boxes):
             label="Flat Lid (Drawer Bay)"
         )
 
-        # Alignment tabs (small squares to glue under lid)
-        for i in range(4):
-            self.rectangularWall(
-                tab_size * 2,
-                tab_size * 2,
-                "eeee",
-                move="right" if i < 3 else "up",
-                label=f"Alignment Tab {i + 1}"
-            )
+        # Alignment tabs (small squares to glue under lid), placed as one row
+        # of four. The plain edge objects are looked up once instead of
+        # parsing "eeee" per tab.
+        tab_edges = (self.edges["e"],) * 4
+        self.partsMatrix(
+            4, 4, "up",
+            self.rectangularWall,
+            tab_size * 2,
+            tab_size * 2,
+            tab_edges,
+            label="Alignment Tab"
+        )
 
 
-def generate_lids() -> Path:
-    """Generate lids SVG file.
+def render_lids(output_file: Path) -> BytesIO:
+    """Render the lids SVG in memory.
+
+    Args:
+        output_file: Output path recorded in the Boxes.py arguments.
 
     Returns:
-        Path to the generated SVG file.
+        The SVG data returned by Boxes.close().
     """
-    output_path = Path(OUTPUT_DIR)
-    output_path.mkdir(parents=True, exist_ok=True)
-
-    output_file = output_path / "lids.svg"
-
     lids = LidGenerator()
     lids.parseArgs([
         "--output", str(output_file),
@@ -168,23 +133,26 @@ def generate_lids() -> Path:
 
     lids.open()
     lids.render()
-    data = lids.close()
-
-    with open(output_file, "wb") as f:
-        f.write(data.getvalue())
-
-    # Calculate dimensions for output
-    t = DRAWER_MATERIAL_THICKNESS
-    internal_width = SHELL["width"] - 2 * t
-    internal_depth = SHELL["depth"] - 2 * t
-    paper_width = PAPER_COMPARTMENT_DEPTH - t
-    drawer_bay_width = internal_width - paper_width - t
-
-    print(f"Generated lids SVG: {output_file.absolute()}")
-    print(f"  Sliding lid (paper): ~{paper_width:.1f}mm x {internal_depth:.1f}mm")
-    print(f"  Flat lid (drawer bay): ~{drawer_bay_width:.1f}mm x {internal_depth:.1f}mm")
-    print(f"  Groove width: {LID_GROOVE_WIDTH}mm, depth: {LID_GROOVE_DEPTH}mm")
-    print(f"  Material thickness: {DRAWER_MATERIAL_THICKNESS}mm")
+    return lids.close()
+
+
+def generate_lids() -> Path:
+    """Generate lids SVG file.
+
+    Returns:
+        Path to the generated SVG file.
+    """
+    output_path = Path(OUTPUT_DIR)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    output_file = output_path / "lids.svg"
+
+    if build_output(output_file, __file__, render_lids, "Lids"):
+        print(f"Generated lids SVG: {output_file.absolute()}")
+        print(f"  Sliding lid (paper): ~{PAPER_WIDTH:.1f}mm x {INTERNAL_DEPTH:.1f}mm")
+        print(f"  Flat lid (drawer bay): ~{DRAWER_BAY_WIDTH:.1f}mm x {INTERNAL_DEPTH:.1f}mm")
+        print(f"  Groove width: {LID_GROOVE_WIDTH}mm, depth: {LID_GROOVE_DEPTH}mm")
+        print(f"  Material thickness: {DRAWER_MATERIAL_THICKNESS}mm")
     return output_file
 
 
@@ -6,13 +6,105 @@ Color coding for Ponoko:
 - Red (#FF0000): Engrave lines
 """
 
+import functools
+import hashlib
+import mmap
+import os
 import re
-import xml.etree.ElementTree as ET
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import NamedTuple
+from typing import Mapping, NamedTuple, Optional, Union
+
+try:
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
 
 from faxbox.config import OUTPUT_DIR
 
+# Part SVGs are given either as file paths or as data rendered in memory
+SvgSource = Union[str, Path, bytes]
+
+# How much of a file to read when looking for the root <svg> tag
+_HEAD_SIZE = 2048
+
+_RE_XML_DECL = re.compile(rb'<\?xml[^?]*\?>\s*')
+_RE_ATTRIBUTE = re.compile(r'([\w:.-]+)=(["\'])(.*?)\2')
+_RE_PATH_ELEMENT = re.compile(r'<path\s([^>]*?)\s*/>')
+
+# Blocks stripped from the inner SVG content: boxes.py metadata carries
+# namespace prefixes that break the combined SVG
+_STRIPPED_BLOCKS = (
+    (b"<metadata>", b"</metadata>"),
+    (b"<title>", b"</title>"),
+    (b"<!--", b"-->"),
+)
+
+# Single-pass rewrite of the remaining content: convert black strokes to
+# Ponoko cut blue and compact path data. Cleanup works on the raw bytes and
+# only the cleaned result is decoded.
+_SVG_CLEANUP = re.compile(
+    rb'(?P<stroke>stroke="(?:rgb\(0,0,0\)|#000000|black)")'
+    rb'|(?<=\s)d="(?P<d>[^"]*)"'
+)
+
+_PONOKO_STROKES = {
+    b'stroke="rgb(0,0,0)"': b'stroke="rgb(0,0,255)"',
+    b'stroke="#000000"': b'stroke="#0000FF"',
+    b'stroke="black"': b'stroke="#0000FF"',
+}
+
+
+# Templates for the combined layout SVG
+_SVG_HEADER = """<?xml version='1.0' encoding='utf-8'?>
+<svg
+    height="%(total_height)smm"
+    width="%(total_width)smm"
+    viewBox="0 0 %(total_width)s %(total_height)s"
+    xmlns="http://www.w3.org/2000/svg"
+    xmlns:xlink="http://www.w3.org/1999/xlink"
+    xmlns:inkscape="http://www.inkscape.org/namespaces/inkscape">
+<!--
+Fax Machine Box - Final Assembly Layout
+All parts combined for laser cutting service (e.g., Ponoko)
+
+Color coding:
+  Blue (#0000FF) = Cut lines
+  Red (#FF0000) = Engrave lines
+
+Parts included:
+  - Outer shell (all pieces)
+  - 2x Drawer sets (5 pieces each)
+  - 2x Lid sets
+
+Material: 3.175mm (1/8") plywood
+Total dimensions: %(total_width).1fmm x %(total_height).1fmm
+-->
+<title>Fax Machine Box - Final Layout</title>
+"""
+_GROUP_OPEN = """
+<!-- %s -->
+<g id="%s" transform="translate(%s, %s)" inkscape:label="%s">
+"""
+_GROUP_CLOSE = """
+</g>
+"""
+_DRAWER_DEFS_OPEN = """
+<!-- Drawer (shared by both drawers) -->
+<defs>
+<g id="drawer-template">
+"""
+_DRAWER_DEFS_CLOSE = """
+</g>
+</defs>
+"""
+_DRAWER_USE = """
+<!-- %s -->
+<use id="%s" xlink:href="#drawer-template" transform="translate(%s, %s)" inkscape:label="%s"/>
+"""
+_SVG_FOOTER = "\n</svg>"
+
 
 class BoundingBox(NamedTuple):
     """Bounding box with width and height in mm."""
@@ -20,70 +112,256 @@ class BoundingBox(NamedTuple):
     height: float
 
 
-def parse_svg_dimensions(svg_path: Path) -> BoundingBox:
-    """Extract width and height from SVG viewBox or dimensions."""
-    tree = ET.parse(svg_path)
-    root = tree.getroot()
+def _root_attributes(head: str) -> Optional[dict[str, str]]:
+    """Attributes of the root <svg> tag, or None if it isn't within head."""
+    start = head.find("<svg")
+    end = head.find(">", start) if start >= 0 else -1
+    if end < 0:
+        return None
+    root_tag = head[start:end]
+    return {
+        match.group(1): match.group(3)
+        for match in _RE_ATTRIBUTE.finditer(root_tag)
+    }
 
+
+def _dimensions_from_attributes(attributes: Mapping[str, str]) -> BoundingBox:
+    """Width and height from the root <svg> element's attributes."""
     # Try viewBox first (format: "minX minY width height")
-    viewbox = root.get("viewBox")
+    viewbox = attributes.get("viewBox")
     if viewbox:
         parts = viewbox.split()
         if len(parts) == 4:
             return BoundingBox(float(parts[2]), float(parts[3]))
 
     # Fall back to width/height attributes
-    width = root.get("width", "0").replace("mm", "")
-    height = root.get("height", "0").replace("mm", "")
+    width = attributes.get("width", "0").replace("mm", "")
+    height = attributes.get("height", "0").replace("mm", "")
     return BoundingBox(float(width), float(height))
 
 
+def _file_key(svg: Union[str, Path]) -> tuple[str, int, int]:
+    """Cache key for an SVG file: its path, modification time and size.
+
+    The size catches rewrites that land within the same timestamp tick.
+    """
+    path = Path(svg)
+    stat = path.stat()
+    return str(path), stat.st_mtime_ns, stat.st_size
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_dimensions_cached(path_str: str, mtime_ns: int, size: int) -> BoundingBox:
+    """Parse SVG dimensions, memoized on (path, modification time, size)."""
+    # The root <svg> tag is within the first few hundred bytes of boxes.py
+    # output, so read its attributes from the head of the file and only
+    # parse the whole document if the tag isn't there
+    with open(path_str, "rb") as f:
+        head = f.read(_HEAD_SIZE).decode("utf-8", errors="ignore")
+
+    attributes = _root_attributes(head)
+    if attributes is None:
+        attributes = ET.parse(path_str).getroot().attrib
+    return _dimensions_from_attributes(attributes)
+
+
+def parse_svg_dimensions(svg: SvgSource) -> BoundingBox:
+    """Extract width and height from SVG viewBox or dimensions.
+
+    Args:
+        svg: Path to an SVG file, or SVG data already in memory. Results for
+            files are cached until the file's modification time or size
+            changes.
+    """
+    if isinstance(svg, bytes):
+        attributes = _root_attributes(svg[:_HEAD_SIZE].decode("utf-8", errors="ignore"))
+        if attributes is None:
+            attributes = ET.fromstring(svg).attrib
+        return _dimensions_from_attributes(attributes)
+    return _parse_dimensions_cached(*_file_key(svg))
+
+
 def convert_colors_to_ponoko(content: str) -> str:
     """Convert all stroke colors to Ponoko standard (blue=cut, red=engrave).
 
-    Black and other colors are converted to blue (cut).
-    Red is preserved for engraving.
+    Black strokes are converted to blue (cut) using the same mapping as
+    extract_svg_content(). Red is preserved for engraving.
     """
-    # Convert black to blue
-    content = re.sub(r'stroke="rgb\(0,0,0\)"', 'stroke="rgb(0,0,255)"', content)
-    content = re.sub(r'stroke="#000000"', 'stroke="#0000FF"', content)
-    content = re.sub(r'stroke="black"', 'stroke="#0000FF"', content)
-
+    for black, blue in _PONOKO_STROKES.items():
+        content = content.replace(black.decode("ascii"), blue.decode("ascii"))
     return content
 
 
-def extract_svg_content(svg_path: Path) -> str:
-    """Extract the inner content of an SVG (everything inside <svg> tags)."""
-    with open(svg_path, "r") as f:
-        content = f.read()
-
-    # Remove XML declaration
-    content = re.sub(r'<\?xml[^?]*\?>\s*', '', content)
+def _optimize_path_data(d: str) -> str:
+    """Compact absolute M/L/C/Z path data as written by boxes.py.
 
+    Only lossless rewrites: axis-aligned lines become H/V commands and
+    curves are kept as they are. Path data using any other command is
+    returned unchanged.
+    """
+    tokens = d.split()
+    out = []
+    current = start = None
+    i = 0
+    try:
+        while i < len(tokens):
+            command = tokens[i]
+            if command == "M":
+                x, y = tokens[i + 1:i + 3]
+                out.append(f"M {x} {y}")
+                current = start = (x, y)
+                i += 3
+                continue
+            if command == "Z":
+                out.append("Z")
+                current = start
+                i += 1
+                continue
+            if command == "L":
+                x, y = tokens[i + 1:i + 3]
+                i += 3
+            elif command == "C":
+                points = tokens[i + 1:i + 7]
+                if len(points) < 6:
+                    return d
+                out.append("C " + " ".join(points))
+                current = (points[4], points[5])
+                i += 7
+                continue
+            else:
+                return d
+
+            if float(y) == float(current[1]):
+                out.append(f"H {x}")
+            elif float(x) == float(current[0]):
+                out.append(f"V {y}")
+            else:
+                out.append(f"L {x} {y}")
+            current = (x, y)
+    except (IndexError, TypeError, ValueError):
+        return d
+
+    return " ".join(out)
+
+
+def _cleanup_match(match: re.Match) -> bytes:
+    """Replacement for _SVG_CLEANUP: recolor strokes, compact paths."""
+    stroke = match.group("stroke")
+    if stroke is not None:
+        return _PONOKO_STROKES[stroke]
+    d = _optimize_path_data(match.group("d").decode("ascii"))
+    return b'd="' + d.encode("ascii") + b'"'
+
+
+def _strip_block(content: bytes, open_tag: bytes, close_tag: bytes) -> bytes:
+    """Remove every open_tag...close_tag block with a linear scan."""
+    out = []
+    i = 0
+    while True:
+        start = content.find(open_tag, i)
+        if start < 0:
+            break
+        end = content.find(close_tag, start + len(open_tag))
+        if end < 0:
+            break
+        out.append(content[i:start])
+        i = end + len(close_tag)
+    out.append(content[i:])
+    return b"".join(out)
+
+
+def _extract_content(data: Union[bytes, mmap.mmap]) -> str:
+    """Inner content of SVG data (bytes or an mmap), cleaned up for embedding."""
     # Extract content between <svg> tags, removing the outer svg element
-    match = re.search(r'<svg[^>]*>(.*)</svg>', content, re.DOTALL)
-    if match:
-        content = match.group(1)
+    # (and with it the XML declaration)
+    start = data.find(b"<svg")
+    open_end = data.find(b">", start) if start >= 0 else -1
+    end = data.rfind(b"</svg>")
+    if 0 <= open_end < end:
+        content = data[open_end + 1:end]
+    else:
+        content = _RE_XML_DECL.sub(b"", data)
 
-    # Remove metadata blocks (contain namespace prefixes that break combined SVG)
-    content = re.sub(r'<metadata>.*?</metadata>', '', content, flags=re.DOTALL)
-    content = re.sub(r'<title>.*?</title>', '', content, flags=re.DOTALL)
+    for open_tag, close_tag in _STRIPPED_BLOCKS:
+        content = _strip_block(content, open_tag, close_tag)
 
-    # Remove comments (boxes.py metadata)
-    content = re.sub(r'<!--.*?-->', '', content, flags=re.DOTALL)
+    return _SVG_CLEANUP.sub(_cleanup_match, content).decode("utf-8")
 
-    # Convert colors to Ponoko standard
-    content = convert_colors_to_ponoko(content)
 
-    return content
+@functools.lru_cache(maxsize=32)
+def _extract_cached(path_str: str, mtime_ns: int, size: int) -> str:
+    """Extract SVG content, memoized on (path, modification time, size)."""
+    # Map the file rather than reading it into memory; only the slice inside
+    # the root <svg> element gets copied out
+    with open(path_str, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return _extract_content(data)
+
+
+def extract_svg_content(svg: SvgSource) -> str:
+    """Extract the inner content of an SVG (everything inside <svg> tags).
+
+    Args:
+        svg: Path to an SVG file, or SVG data already in memory. Results for
+            files are cached until the file's modification time or size
+            changes.
+    """
+    if isinstance(svg, bytes):
+        return _extract_content(svg)
+    return _extract_cached(*_file_key(svg))
+
+
+def _path_key(attributes: str) -> bytes:
+    """Compact hash identifying a <path> element by its attributes."""
+    return hashlib.blake2b(attributes.encode(), digest_size=16).digest()
+
+
+def _has_id(attributes: str) -> bool:
+    """Whether an element's attribute text includes an id attribute."""
+    return any(match.group(1) == "id" for match in _RE_ATTRIBUTE.finditer(attributes))
+
+
+def dedup_paths(contents: list[str]) -> list[str]:
+    """Replace repeated identical <path> elements with <use> references.
+
+    The first occurrence of a path that appears more than once (across all
+    of the given SVG fragments) gets an id; later occurrences reference it.
+    Paths that already carry an id are left alone.
+
+    The result relies on the importer resolving <use> references, which
+    many laser-cutting importers flatten or drop, so create_layout_svg()
+    only applies this when asked to.
+    """
+    counts = Counter(
+        _path_key(match.group(1))
+        for content in contents
+        for match in _RE_PATH_ELEMENT.finditer(content)
+    )
+    path_ids = {}
+
+    def replace(match: re.Match) -> str:
+        attributes = match.group(1)
+        key = _path_key(attributes)
+        if counts[key] < 2 or _has_id(attributes):
+            return match.group(0)
+        if key in path_ids:
+            return f'<use xlink:href="#{path_ids[key]}"/>'
+        path_ids[key] = f"path-{len(path_ids)}"
+        return f'<path id="{path_ids[key]}" {attributes}/>'
+
+    return [_RE_PATH_ELEMENT.sub(replace, content) for content in contents]
 
 
 def create_layout_svg(
-    shell_svg: Path,
-    drawer_svg: Path,
-    lids_svg: Path,
+    shell_svg: SvgSource,
+    drawer_svg: SvgSource,
+    lids_svg: SvgSource,
     output_path: Path,
-    spacing: float = 5.0
+    spacing: float = 5.0,
+    share_paths: bool = False,
+    instance_drawers: bool = False,
 ) -> None:
     """Combine all part SVGs into a single layout.
 
@@ -92,11 +370,17 @@ def create_layout_svg(
     - Row 2: Two drawer sets side by side, then lids
 
     Args:
-        shell_svg: Path to outer shell SVG
-        drawer_svg: Path to drawer SVG (will be duplicated for 2 drawers)
-        lids_svg: Path to lids SVG
+        shell_svg: Outer shell SVG (file path or in-memory data)
+        drawer_svg: Drawer SVG (placed twice for 2 drawers)
+        lids_svg: Lids SVG
         output_path: Path for output combined SVG
         spacing: Gap between parts in mm
+        share_paths: Emit paths repeated across parts once and reference
+            them with <use> (see dedup_paths). Off by default so the cut
+            file doesn't depend on the importer resolving references.
+        instance_drawers: Define the drawer once in <defs> and place both
+            drawers with <use>. Off by default: an importer that drops
+            <use> would silently lose both drawers.
     """
     # Get dimensions of each component
     shell_box = parse_svg_dimensions(shell_svg)
@@ -121,77 +405,88 @@ def create_layout_svg(
     drawer_content = extract_svg_content(drawer_svg)
     lids_content = extract_svg_content(lids_svg)
 
-    # Build the combined SVG
-    svg_header = f'''<?xml version='1.0' encoding='utf-8'?>
-<svg
-    height="{total_height}mm"
-    width="{total_width}mm"
-    viewBox="0 0 {total_width} {total_height}"
-    xmlns="http://www.w3.org/2000/svg"
-    xmlns:inkscape="http://www.inkscape.org/namespaces/inkscape">
-<!--
-Fax Machine Box - Final Assembly Layout
-All parts combined for laser cutting service (e.g., Ponoko)
-
-Color coding:
-  Blue (#0000FF) = Cut lines
-  Red (#FF0000) = Engrave lines
-
-Parts included:
-  - Outer shell (all pieces)
-  - 2x Drawer sets (5 pieces each)
-  - 2x Lid sets
-
-Material: 3.175mm (1/8") plywood
-Total dimensions: {total_width:.1f}mm x {total_height:.1f}mm
--->
-<title>Fax Machine Box - Final Layout</title>
-'''
-
-    # Position each group
-    # Row 1: Shell at origin
-    shell_group = f'''
-<!-- Outer Shell Parts -->
-<g id="outer-shell" transform="translate(0, 0)" inkscape:label="Outer Shell">
-{shell_content}
-</g>
-'''
-
-    # Row 2: Drawer 1
-    drawer1_y = row1_height + spacing
-    drawer1_group = f'''
-<!-- Drawer 1 -->
-<g id="drawer-1" transform="translate(0, {drawer1_y})" inkscape:label="Drawer 1">
-{drawer_content}
-</g>
-'''
-
-    # Row 2: Drawer 2
+    # Without instancing the drawer geometry is written twice, so both copies
+    # take part in path sharing (the first one defines any shared paths)
+    if share_paths and instance_drawers:
+        shell_content, drawer_content, lids_content = dedup_paths(
+            [shell_content, drawer_content, lids_content]
+        )
+        drawer2_content = drawer_content
+    elif share_paths:
+        shell_content, drawer_content, drawer2_content, lids_content = dedup_paths(
+            [shell_content, drawer_content, drawer_content, lids_content]
+        )
+    else:
+        drawer2_content = drawer_content
+
+    # Row 2 sits below the shell
+    row2_y = row1_height + spacing
     drawer2_x = drawer_box.width + spacing
-    drawer2_group = f'''
-<!-- Drawer 2 -->
-<g id="drawer-2" transform="translate({drawer2_x}, {drawer1_y})" inkscape:label="Drawer 2">
-{drawer_content}
-</g>
-'''
-
-    # Row 2: Lids
     lids_x = drawer_box.width * 2 + spacing * 2
-    lids_group = f'''
-<!-- Lids (Sliding + Flat) -->
-<g id="lids" transform="translate({lids_x}, {drawer1_y})" inkscape:label="Lids">
-{lids_content}
-</g>
-'''
 
-    svg_footer = "\n</svg>"
+    parts = [
+        _SVG_HEADER % {"total_width": total_width, "total_height": total_height},
+        _GROUP_OPEN % ("Outer Shell Parts", "outer-shell", 0, 0, "Outer Shell"),
+        shell_content,
+        _GROUP_CLOSE,
+    ]
+    if instance_drawers:
+        # Both drawers instance a single drawer definition so its geometry
+        # is only emitted once
+        parts += [
+            _DRAWER_DEFS_OPEN,
+            drawer_content,
+            _DRAWER_DEFS_CLOSE,
+            _DRAWER_USE % ("Drawer 1", "drawer-1", 0, row2_y, "Drawer 1"),
+            _DRAWER_USE % ("Drawer 2", "drawer-2", drawer2_x, row2_y, "Drawer 2"),
+        ]
+    else:
+        parts += [
+            _GROUP_OPEN % ("Drawer 1", "drawer-1", 0, row2_y, "Drawer 1"),
+            drawer_content,
+            _GROUP_CLOSE,
+            _GROUP_OPEN % ("Drawer 2", "drawer-2", drawer2_x, row2_y, "Drawer 2"),
+            drawer2_content,
+            _GROUP_CLOSE,
+        ]
+    parts += [
+        _GROUP_OPEN % ("Lids (Sliding + Flat)", "lids", lids_x, row2_y, "Lids"),
+        lids_content,
+        _GROUP_CLOSE,
+        _SVG_FOOTER,
+    ]
+
+    # Write each part straight to the file rather than concatenating them
+    # into one combined string first
+    with open(output_path, "w", buffering=1 << 16) as f:
+        f.writelines(parts)
+
+
+def _print_layout_summary(
+    final_layout: Path,
+    shell_svg: SvgSource,
+    drawer_svg: SvgSource,
+    lids_svg: SvgSource,
+) -> None:
+    """Print the final layout's dimensions and contents."""
+    shell_box = parse_svg_dimensions(shell_svg)
+    drawer_box = parse_svg_dimensions(drawer_svg)
+    lids_box = parse_svg_dimensions(lids_svg)
 
-    # Combine all parts
-    combined_svg = svg_header + shell_group + drawer1_group + drawer2_group + lids_group + svg_footer
+    row2_width = drawer_box.width * 2 + lids_box.width + 10  # spacing
+    total_width = max(shell_box.width, row2_width)
+    total_height = shell_box.height + 5 + max(drawer_box.height, lids_box.height)
 
-    # Write output
-    with open(output_path, "w") as f:
-        f.write(combined_svg)
+    print(f"Generated final layout: {final_layout.absolute()}")
+    print(f"\nLayout dimensions: {total_width:.1f}mm x {total_height:.1f}mm")
+    print(f"  ({total_width / 25.4:.1f}\" x {total_height / 25.4:.1f}\")")
+    print(f"\nParts included:")
+    print(f"  - Outer shell: {shell_box.width:.1f}mm x {shell_box.height:.1f}mm")
+    print(f"  - 2x Drawers: {drawer_box.width:.1f}mm x {drawer_box.height:.1f}mm each")
+    print(f"  - Lids: {lids_box.width:.1f}mm x {lids_box.height:.1f}mm")
+    print(f"\nColor coding:")
+    print(f"  Blue (#0000FF) = Cut lines")
+    print(f"  Red (#FF0000) = Engrave lines")
 
 
 def generate_layout() -> Path:
@@ -227,25 +522,65 @@ def generate_layout() -> Path:
     # Create the combined layout
     create_layout_svg(shell_svg, drawer_svg, lids_svg, final_layout)
 
-    # Get final dimensions
-    shell_box = parse_svg_dimensions(shell_svg)
-    drawer_box = parse_svg_dimensions(drawer_svg)
-    lids_box = parse_svg_dimensions(lids_svg)
+    _print_layout_summary(final_layout, shell_svg, drawer_svg, lids_svg)
 
-    row2_width = drawer_box.width * 2 + lids_box.width + 10  # spacing
-    total_width = max(shell_box.width, row2_width)
-    total_height = shell_box.height + 5 + max(drawer_box.height, lids_box.height)
+    return final_layout
 
-    print(f"Generated final layout: {final_layout.absolute()}")
-    print(f"\nLayout dimensions: {total_width:.1f}mm x {total_height:.1f}mm")
-    print(f"  ({total_width / 25.4:.1f}\" x {total_height / 25.4:.1f}\")")
-    print(f"\nParts included:")
-    print(f"  - Outer shell: {shell_box.width:.1f}mm x {shell_box.height:.1f}mm")
-    print(f"  - 2x Drawers: {drawer_box.width:.1f}mm x {drawer_box.height:.1f}mm each")
-    print(f"  - Lids: {lids_box.width:.1f}mm x {lids_box.height:.1f}mm")
-    print(f"\nColor coding:")
-    print(f"  Blue (#0000FF) = Cut lines")
-    print(f"  Red (#FF0000) = Engrave lines")
+
+def generate_all() -> list[Path]:
+    """Generate every part SVG file, each in its own process.
+
+    The generators are independent, so the shell, drawer, lids and test box
+    renders overlap instead of running one after another. Parts already up
+    to date are skipped by each generator as usual.
+
+    Returns:
+        Paths to the generated SVG files.
+    """
+    # Imported here so the layout step alone doesn't need Boxes.py loaded
+    from faxbox.generate_drawers import generate_drawer
+    from faxbox.generate_lids import generate_lids
+    from faxbox.shell_generator import generate_shell
+    from faxbox.test_generator import generate_test_box
+
+    generators = [generate_shell, generate_drawer, generate_lids, generate_test_box]
+    with ProcessPoolExecutor(max_workers=len(generators)) as executor:
+        futures = [executor.submit(generator) for generator in generators]
+        return [future.result() for future in futures]
+
+
+def build_all() -> Path:
+    """Generate every part, then the final layout combining them.
+
+    The shell, drawer and lids are rendered in separate processes since
+    each Boxes.py render is CPU-bound pure Python. The rendered SVG data
+    is combined in memory rather than written out and read back.
+
+    Returns:
+        Path to the generated layout SVG.
+    """
+    # Imported here so the layout step alone doesn't need Boxes.py loaded
+    from faxbox.generate_drawers import render_drawer
+    from faxbox.generate_lids import render_lids
+    from faxbox.shell_generator import render_shell
+
+    output_path = Path(OUTPUT_DIR)
+    output_path.mkdir(parents=True, exist_ok=True)
+    final_layout = output_path / "final_layout.svg"
+
+    with ProcessPoolExecutor(max_workers=3) as executor:
+        futures = [
+            executor.submit(render, output_path / name)
+            for render, name in (
+                (render_shell, "outer_shell.svg"),
+                (render_drawer, "drawer.svg"),
+                (render_lids, "lids.svg"),
+            )
+        ]
+        shell_svg, drawer_svg, lids_svg = (future.result().getvalue() for future in futures)
+
+    create_layout_svg(shell_svg, drawer_svg, lids_svg, final_layout)
+    _print_layout_summary(final_layout, shell_svg, drawer_svg, lids_svg)
 
     return final_layout
 
@@ -1,10 +1,15 @@
 """Generate outer shell for fax machine box with internal dividers."""
 
+__all__ = ["OuterShell", "generate_shell", "render_shell"]
+
+import functools
+from io import BytesIO
 from pathlib import Path
 
-from boxes import Boxes
+from boxes import Boxes, holeCol
 from boxes import edges
 
+from faxbox.build_cache import build_output
 from faxbox.config import (
     BURN,
     DRAWER,
@@ -57,6 +62,84 @@ PIXEL_FONT = {
     ' ': [],
 }
 
+# Each 5x7 glyph packed into one int: bit (row from the top * 5 + column) is
+# set for every lit pixel. The rows above are bottom-up, so they are flipped
+# once here rather than for every pixel drawn.
+PIXEL_FONT_BITS = {
+    char: sum(1 << ((6 - row) * 5 + col) for col, row in pixels)
+    for char, pixels in PIXEL_FONT.items()
+}
+
+# Glyph bitmasks indexed by character code, so text encoded to ASCII bytes
+# looks glyphs up by list index. Unknown characters map to 0 (no glyph).
+FONT_TABLE = [PIXEL_FONT_BITS.get(chr(code), 0) for code in range(256)]
+
+
+# Pixel rectangle as (x, y, width, height)
+_Rect = tuple[float, float, float, float]
+
+
+@functools.lru_cache(maxsize=32)
+def _layout_text(text: str, pixel_size: float) -> tuple[float, float, float, float]:
+    """Pixel-font metrics for text: (width, height, pixel inset, pixel cell).
+
+    Each pixel is drawn as a cell slightly smaller than the grid, inset
+    by half the gap on every side.
+    """
+    char_width = 5 * pixel_size + ENGRAVE_FONT_SPACING
+    text_width = len(text) * char_width - ENGRAVE_FONT_SPACING
+    text_height = 7 * pixel_size
+    pixel_cell = pixel_size * 0.85
+    half = (pixel_size - pixel_cell) / 2
+    return text_width, text_height, half, pixel_cell
+
+
+@functools.lru_cache(maxsize=128)
+def _glyph_rects(code: int, pixel_size: float) -> tuple[_Rect, ...]:
+    """Pixel rectangles for one character code drawn at the origin.
+
+    Decoded from the glyph bitmask once per (character, pixel size) and
+    reused for every occurrence of the character.
+    """
+    mask = FONT_TABLE[code]
+    if not mask:
+        return ()
+    _, _, half, pixel_cell = _layout_text(chr(code), pixel_size)
+    rects = []
+    while mask:
+        bit = mask & -mask
+        mask ^= bit
+        row, col = divmod(bit.bit_length() - 1, 5)
+        rects.append((half + col * pixel_size, half + row * pixel_size, pixel_cell, pixel_cell))
+    return tuple(rects)
+
+
+@functools.lru_cache(maxsize=32)
+def _text_rects(text: str, pixel_size: float) -> tuple[tuple[_Rect, ...], float]:
+    """Pixel rectangles (x, y, width, height) for text drawn at the origin.
+
+    Returns the rectangles for the whole string and its total advance, so
+    callers translate and emit them in one pass instead of per character.
+    """
+    rects = []
+    current_x = 0.0
+    # Non-ASCII characters become "?", which has no glyph either
+    for code in text.upper().encode("ascii", errors="replace"):
+        glyph = _glyph_rects(code, pixel_size)
+        if not glyph:
+            current_x += pixel_size * 3
+            continue
+        rects.extend((current_x + x, y, width, height) for x, y, width, height in glyph)
+        current_x += pixel_size * 5 + ENGRAVE_FONT_SPACING
+    return tuple(rects), current_x
+
+
+# The front wall engraving never changes, so its rectangles are laid out
+# once at import
+FRONT_ENGRAVING_TEXT = "FAX MACHINE"
+FRONT_ENGRAVING_PIXEL_SIZE = 3.0
+FAX_MACHINE_RECTS, _ = _text_rects(FRONT_ENGRAVING_TEXT, FRONT_ENGRAVING_PIXEL_SIZE)
+
 
 class OuterShell(Boxes):
     """Outer shell with internal vertical divider and horizontal shelf."""
@@ -66,32 +149,48 @@ class OuterShell(Boxes):
         self.buildArgParser("x", "y", "h", "outside")
         self.addSettingsArgs(edges.FingerJointSettings)
 
-    def draw_pixel_char(self, char: str, x: float, y: float, pixel_size: float) -> float:
-        """Draw a single character using pixel font."""
-        if char not in PIXEL_FONT:
-            return pixel_size * 3
-        pixels = PIXEL_FONT[char]
-        if not pixels:
-            return pixel_size * 3
-        pixel_cell = pixel_size * 0.85
-        for col, row in pixels:
-            px = x + col * pixel_size + (pixel_size - pixel_cell) / 2
-            py = y + (6 - row) * pixel_size + (pixel_size - pixel_cell) / 2
-            self.ctx.move_to(px, py)
-            self.ctx.line_to(px + pixel_cell, py)
-            self.ctx.line_to(px + pixel_cell, py + pixel_cell)
-            self.ctx.line_to(px, py + pixel_cell)
-            self.ctx.line_to(px, py)
-            self.ctx.stroke()
-        return pixel_size * 5 + ENGRAVE_FONT_SPACING
+    def _emit_rects(self, rects: tuple[_Rect, ...], x: float, y: float) -> None:
+        """Add precomputed pixel rectangles, offset by (x, y), to the current path."""
+        rectangle = self.ctx.rectangle
+        for rx, ry, width, height in rects:
+            rectangle(x + rx, y + ry, width, height)
 
     def draw_pixel_text(self, text: str, x: float, y: float, pixel_size: float = ENGRAVE_FONT_SIZE) -> None:
         """Draw text using pixel font with engraving color (red)."""
         self.set_source_color(ENGRAVE_COLOR)
-        current_x = x
-        for char in text.upper():
-            width = self.draw_pixel_char(char, current_x, y, pixel_size)
-            current_x += width
+        if text == FRONT_ENGRAVING_TEXT and pixel_size == FRONT_ENGRAVING_PIXEL_SIZE:
+            rects = FAX_MACHINE_RECTS
+        else:
+            rects, _ = _text_rects(text, pixel_size)
+        self._emit_rects(rects, x, y)
+        # One stroke for the whole text: a single <path> the laser follows
+        # continuously instead of one per pixel. Boxes.py's context has no
+        # fill(), so the pixels are engraved as closed outlines.
+        self.ctx.stroke()
+
+    def _lid_groove(self) -> None:
+        """Cut the sliding lid groove across the top of the paper compartment."""
+        groove_y = self.h - LID_GROOVE_DEPTH / 2
+        paper_depth = PAPER_COMPARTMENT_DEPTH
+        self.rectangularHole(paper_depth / 2, groove_y, paper_depth - 2 * self.thickness, LID_GROOVE_WIDTH, r=0)
+
+    @holeCol
+    def _drawer_openings(self, y_centers: tuple[float, ...], r: float = 2.0) -> None:
+        """Cut the drawer openings in the front wall as one path.
+
+        Traces the same outline as rectangularHole() for each opening, but
+        holeCol strokes once after all of them instead of once per hole.
+        """
+        dx, dy = DRAWER["width"], DRAWER["height"]
+        r = min(r, dx / 2, dy / 2)
+        opening_x = PAPER_COMPARTMENT_DEPTH + self.thickness + dx / 2
+        for y_center in y_centers:
+            with self.saved_context():
+                self.moveTo(opening_x, y_center - dy / 2, 180)
+                self.edge(dx / 2 - r)
+                for length in (dy, dx, dy, dx / 2 + r):
+                    self.corner(-90, r)
+                    self.edge(length - 2 * r)
 
     def render(self) -> None:
         """Render all shell pieces."""
@@ -113,53 +212,49 @@ class OuterShell(Boxes):
         paper_depth = PAPER_COMPARTMENT_DEPTH
         drawer_bay_depth = y - paper_depth - t
         shelf_height = (h - t) / 2
-        drawer_width = DRAWER["width"]
         drawer_height = DRAWER["height"]
 
-        def add_left_lid_groove():
-            groove_y = h - LID_GROOVE_DEPTH / 2
-            self.rectangularHole(paper_depth / 2, groove_y, paper_depth - 2 * t, LID_GROOVE_WIDTH, r=0)
+        # Looked up once rather than on self for every part
+        wall = self.rectangularWall
+        hole = self.rectangularHole
 
-        self.rectangularWall(y, h, "FfFf", callback=[add_left_lid_groove, None, None, None], move="right", label="Left Wall")
-        self.rectangularWall(y, h, "FfFf", move="up", label="Right Wall")
+        wall(y, h, "FfFf", callback=[self._lid_groove, None, None, None], move="right", label="Left Wall")
+        wall(y, h, "FfFf", move="up", label="Right Wall")
 
         def add_drawer_openings_and_engraving():
-            opening_x = paper_depth + t + drawer_width / 2
-            bottom_opening_y = t + drawer_height / 2
-            self.rectangularHole(opening_x, bottom_opening_y, drawer_width, drawer_height, r=2)
-            top_opening_y = t + shelf_height + t + drawer_height / 2
-            self.rectangularHole(opening_x, top_opening_y, drawer_width, drawer_height, r=2)
+            self._drawer_openings((
+                t + drawer_height / 2,
+                t + shelf_height + t + drawer_height / 2,
+            ))
             
-            pixel_size = 3.0
-            text = "FAX MACHINE"
-            char_width = 5 * pixel_size + ENGRAVE_FONT_SPACING
-            text_width = len(text) * char_width - ENGRAVE_FONT_SPACING
-            text_height = 7 * pixel_size
+            text_width, text_height, _, _ = _layout_text(FRONT_ENGRAVING_TEXT, FRONT_ENGRAVING_PIXEL_SIZE)
             text_x = (x - text_width) / 2
             text_y = h - text_height - 12
-            self.draw_pixel_text(text, text_x, text_y, pixel_size)
+            self.draw_pixel_text(FRONT_ENGRAVING_TEXT, text_x, text_y, FRONT_ENGRAVING_PIXEL_SIZE)
 
-        self.rectangularWall(x, h, "FFFe", callback=[add_drawer_openings_and_engraving, None, None, None], move="right", label="Front Wall")
-        self.rectangularWall(x, h, "FFFf", move="left", label="Back Wall")
-        self.rectangularWall(x, y, "ffff", move="up", label="Bottom")
+        wall(x, h, "FFFe", callback=[add_drawer_openings_and_engraving, None, None, None], move="right", label="Front Wall")
+        wall(x, h, "FFFf", move="left", label="Back Wall")
+        wall(x, y, "ffff", move="up", label="Bottom")
 
         def add_divider_features():
             slot_x = paper_depth + t + (drawer_bay_depth - t) / 2
-            self.rectangularHole(slot_x, shelf_height, drawer_bay_depth - 2 * t, t, r=0)
-            groove_y = h - LID_GROOVE_DEPTH / 2
-            self.rectangularHole(paper_depth / 2, groove_y, paper_depth - 2 * t, LID_GROOVE_WIDTH, r=0)
+            hole(slot_x, shelf_height, drawer_bay_depth - 2 * t, t, r=0)
+            self._lid_groove()
 
-        self.rectangularWall(y, h, "ffef", callback=[add_divider_features, None, None, None], move="right", label="Vertical Divider")
+        wall(y, h, "ffef", callback=[add_divider_features, None, None, None], move="right", label="Vertical Divider")
         shelf_width = x - paper_depth - t
-        self.rectangularWall(shelf_width, drawer_bay_depth, "efef", move="up", label="Horizontal Shelf")
+        wall(shelf_width, drawer_bay_depth, "efef", move="up", label="Horizontal Shelf")
 
 
-def generate_shell() -> Path:
-    """Generate outer shell SVG file."""
-    output_path = Path(OUTPUT_DIR)
-    output_path.mkdir(parents=True, exist_ok=True)
-    output_file = output_path / "outer_shell.svg"
+def render_shell(output_file: Path) -> BytesIO:
+    """Render the outer shell SVG in memory.
+
+    Args:
+        output_file: Output path recorded in the Boxes.py arguments.
 
+    Returns:
+        The SVG data returned by Boxes.close().
+    """
     shell = OuterShell()
     shell.parseArgs([
         "--output", str(output_file),
@@ -173,15 +268,20 @@ def generate_shell() -> Path:
 
     shell.open()
     shell.render()
-    data = shell.close()
+    return shell.close()
 
-    with open(output_file, "wb") as f:
-        f.write(data.getvalue())
 
-    print(f"Generated outer shell SVG: {output_file.absolute()}")
-    print(f"  External dimensions: {SHELL['width']}mm x {SHELL['depth']}mm x {SHELL['height']}mm")
-    print(f"  Paper compartment depth: {PAPER_COMPARTMENT_DEPTH}mm")
-    print(f"  Material thickness: {DRAWER_MATERIAL_THICKNESS}mm")
+def generate_shell() -> Path:
+    """Generate outer shell SVG file."""
+    output_path = Path(OUTPUT_DIR)
+    output_path.mkdir(parents=True, exist_ok=True)
+    output_file = output_path / "outer_shell.svg"
+
+    if build_output(output_file, __file__, render_shell, "Outer shell"):
+        print(f"Generated outer shell SVG: {output_file.absolute()}")
+        print(f"  External dimensions: {SHELL['width']}mm x {SHELL['depth']}mm x {SHELL['height']}mm")
+        print(f"  Paper compartment depth: {PAPER_COMPARTMENT_DEPTH}mm")
+        print(f"  Material thickness: {DRAWER_MATERIAL_THICKNESS}mm")
     return output_file
 
 
@@ -1,24 +1,23 @@
 """Test generator to verify Boxes.py installation works correctly."""
 
+from io import BytesIO
 from pathlib import Path
 
 from boxes.generators.closedbox import ClosedBox
 
+from faxbox.build_cache import build_output
 from faxbox.config import BURN, DEFAULT_BOX, MATERIAL_THICKNESS, OUTPUT_DIR
 
 
-def generate_test_box() -> Path:
-    """Generate a simple finger-joint box SVG to verify Boxes.py works.
+def render_test_box(output_file: Path) -> BytesIO:
+    """Render the test box SVG in memory.
+
+    Args:
+        output_file: Output path recorded in the Boxes.py arguments.
 
     Returns:
-        Path to the generated SVG file.
+        The SVG data returned by Boxes.close().
     """
-    # Ensure output directory exists
-    output_path = Path(OUTPUT_DIR)
-    output_path.mkdir(parents=True, exist_ok=True)
-
-    output_file = output_path / "test_box.svg"
-
     # Create a ClosedBox generator instance
     box = ClosedBox()
 
@@ -36,13 +35,24 @@ def generate_test_box() -> Path:
     # Initialize canvas and edge objects, then render
     box.open()
     box.render()
-    data = box.close()
+    return box.close()
+
 
-    # Write SVG data to file
-    with open(output_file, "wb") as f:
-        f.write(data.getvalue())
+def generate_test_box() -> Path:
+    """Generate a simple finger-joint box SVG to verify Boxes.py works.
+
+    Returns:
+        Path to the generated SVG file.
+    """
+    # Ensure output directory exists
+    output_path = Path(OUTPUT_DIR)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    output_file = output_path / "test_box.svg"
 
-    print(f"Generated test box SVG: {output_file.absolute()}")
+    # Skips rendering when neither this module nor the config has changed
+    if build_output(output_file, __file__, render_test_box, "Test box"):
+        print(f"Generated test box SVG: {output_file.absolute()}")
     return output_file
 
 
@@ -1,70 +1,83 @@
 """Pytest configuration and fixtures for fax machine box tests."""
 
+from types import MappingProxyType, SimpleNamespace
+
 import pytest
 
-from faxbox.config import (
-    DRAWER,
-    DRAWER_CLEARANCE,
-    DRAWER_MATERIAL_THICKNESS,
-    LID_GROOVE_DEPTH,
-    LID_GROOVE_WIDTH,
-    LID_TAB_CLEARANCE,
-    MATERIAL_THICKNESS,
-    PAPER_COMPARTMENT_DEPTH,
-    SHELL,
-    SLIDING_LID_TAB_DEPTH,
-)
+from faxbox.config import CONFIG
+
+
+@pytest.fixture(scope="session")
+def dims():
+    """Shell and drawer dimensions derived from the config, computed once per session.
+
+    Shell internals come from the same config constants the generators
+    use, so the tests check the sizes that actually get cut.
+    """
+    drawer = CONFIG.drawer
+    t = CONFIG.drawer_material_thickness
+    return SimpleNamespace(
+        shell_internal_width=CONFIG.internal_width,
+        shell_internal_height=CONFIG.internal_height,
+        shell_internal_depth=CONFIG.internal_depth,
+        drawer_external_width=drawer["width"] + 2 * t,
+        drawer_external_depth=drawer["depth"] + 2 * t,
+        drawer_external_height=drawer["height"] + t,  # Bottom only
+        # DRAWER_BAY_WIDTH includes the divider; the drawer only gets the cavity behind it
+        drawer_bay_length=CONFIG.drawer_bay_width - t,
+        required_clearance=2 * CONFIG.drawer_clearance,
+    )
 
 
 @pytest.fixture
 def shell_dims():
-    """External shell dimensions."""
-    return SHELL.copy()
+    """External shell dimensions (read-only; use dict() to get a mutable copy)."""
+    return MappingProxyType(CONFIG.shell)
 
 
 @pytest.fixture
 def drawer_dims():
-    """Internal drawer dimensions."""
-    return DRAWER.copy()
+    """Internal drawer dimensions (read-only; use dict() to get a mutable copy)."""
+    return MappingProxyType(CONFIG.drawer)
 
 
 @pytest.fixture
 def material_thickness():
     """Standard material thickness."""
-    return DRAWER_MATERIAL_THICKNESS
+    return CONFIG.drawer_material_thickness
 
 
 @pytest.fixture
 def drawer_clearance():
     """Clearance per side for drawer sliding."""
-    return DRAWER_CLEARANCE
+    return CONFIG.drawer_clearance
 
 
 @pytest.fixture
 def paper_compartment_depth():
     """Depth of paper compartment from front."""
-    return PAPER_COMPARTMENT_DEPTH
+    return CONFIG.paper_compartment_depth
 
 
 @pytest.fixture
 def lid_groove_width():
     """Width of lid groove in wall."""
-    return LID_GROOVE_WIDTH
+    return CONFIG.lid_groove_width
 
 
 @pytest.fixture
 def lid_groove_depth():
     """Depth of lid groove in wall."""
-    return LID_GROOVE_DEPTH
+    return CONFIG.lid_groove_depth
 
 
 @pytest.fixture
 def lid_tab_clearance():
     """Clearance for lid tabs."""
-    return LID_TAB_CLEARANCE
+    return CONFIG.lid_tab_clearance
 
 
 @pytest.fixture
 def sliding_lid_tab_depth():
     """Depth of sliding lid tab."""
-    return SLIDING_LID_TAB_DEPTH
+    return CONFIG.sliding_lid_tab_depth
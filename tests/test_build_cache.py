@@ -0,0 +1,112 @@
+"""Tests for skipping renders of unchanged part SVGs."""
+
+import os
+from io import BytesIO
+
+from faxbox import build_cache
+from faxbox.build_cache import (
+    CACHE_ENTRIES,
+    build_key,
+    build_output,
+    is_up_to_date,
+    record_build,
+    restore_build,
+)
+
+
+class TestBuildCache:
+    """Tests verifying build keys and their sidecar files."""
+
+    def test_key_depends_on_generator_source(self, tmp_path):
+        """Editing a generator changes its build key."""
+        generator = tmp_path / "generator.py"
+        generator.write_text("WIDTH = 1\n")
+        key = build_key(str(generator))
+
+        assert build_key(str(generator)) == key
+        generator.write_text("WIDTH = 2\n")
+        assert build_key(str(generator)) != key
+
+    def test_output_without_sidecar_is_stale(self, tmp_path):
+        """An SVG without a recorded key is re-rendered."""
+        output_file = tmp_path / "part.svg"
+        output_file.write_text("<svg/>")
+
+        assert not is_up_to_date(output_file, "key")
+
+    def test_recorded_key_must_match(self, tmp_path):
+        """Only an SVG recorded with the same key is up to date."""
+        output_file = tmp_path / "part.svg"
+        output_file.write_text("<svg/>")
+        record_build(output_file, "key")
+
+        assert (tmp_path / "part.svg.hash").read_text() == "key"
+        assert is_up_to_date(output_file, "key")
+        assert not is_up_to_date(output_file, "other")
+
+    def test_missing_output_is_stale(self, tmp_path):
+        """A deleted SVG is re-rendered even if its sidecar remains."""
+        output_file = tmp_path / "part.svg"
+        record_build(output_file, "key")
+
+        assert not is_up_to_date(output_file, "key")
+
+    def test_previous_render_restored_from_cache(self, tmp_path):
+        """Returning to an earlier key restores that render's SVG."""
+        output_file = tmp_path / "part.svg"
+        output_file.write_text("<svg>first</svg>")
+        record_build(output_file, "first")
+        output_file.write_text("<svg>second</svg>")
+        record_build(output_file, "second")
+
+        assert restore_build(output_file, "first")
+        assert output_file.read_text() == "<svg>first</svg>"
+        assert is_up_to_date(output_file, "first")
+
+    def test_unknown_key_not_restored(self, tmp_path):
+        """A key that was never rendered still needs a render."""
+        output_file = tmp_path / "part.svg"
+        output_file.write_text("<svg/>")
+        record_build(output_file, "key")
+
+        assert not restore_build(output_file, "other")
+        assert output_file.read_text() == "<svg/>"
+
+    def test_key_depends_on_boxes_version(self, tmp_path, monkeypatch):
+        """Upgrading Boxes.py changes the build key."""
+        generator = tmp_path / "generator.py"
+        generator.write_text("WIDTH = 1\n")
+
+        monkeypatch.setattr(build_cache, "_boxes_version", lambda: "1.0")
+        key = build_key(str(generator))
+        monkeypatch.setattr(build_cache, "_boxes_version", lambda: "2.0")
+        assert build_key(str(generator)) != key
+
+    def test_old_renders_evicted(self, tmp_path):
+        """Only the most recent CACHE_ENTRIES renders per file are kept."""
+        output_file = tmp_path / "part.svg"
+        keys = [f"{n:032x}" for n in range(CACHE_ENTRIES + 2)]
+        for n, key in enumerate(keys):
+            output_file.write_text(f"<svg>{n}</svg>")
+            record_build(output_file, key)
+            cached = tmp_path / ".cache" / f"part-{key}.svg"
+            os.utime(cached, ns=(n * 1_000_000_000, n * 1_000_000_000))
+
+        remaining = sorted(path.name for path in (tmp_path / ".cache").iterdir())
+        assert remaining == sorted(f"part-{key}.svg" for key in keys[-CACHE_ENTRIES:])
+
+    def test_build_output_renders_once(self, tmp_path, monkeypatch):
+        """A part is rendered on the first build and skipped while unchanged."""
+        monkeypatch.setattr(build_cache, "build_key", lambda generator_file: "0" * 32)
+        output_file = tmp_path / "part.svg"
+        renders = []
+
+        def render(path):
+            renders.append(path)
+            return BytesIO(b"<svg/>")
+
+        assert build_output(output_file, "generator.py", render, "Part")
+        assert not build_output(output_file, "generator.py", render, "Part")
+        assert renders == [output_file]
+        assert output_file.read_bytes() == b"<svg/>"
+        assert is_up_to_date(output_file, "0" * 32)
@@ -21,16 +21,55 @@ from faxbox.config import (
     SLIDING_LID_TAB_DEPTH,
 )
 
+# Finger joint limits
+MIN_FINGER_JOINT_MATERIAL = 2.0  # Thinnest material that holds finger joints
+MIN_FINGER_SIZE = 5.0  # Typical minimum finger size
+MIN_FINGERS = 3  # At least 3 fingers for strength
+MIN_EDGE_FOR_FINGERS = MIN_FINGER_SIZE * MIN_FINGERS * 2  # Fingers + gaps
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _validate_config():
+    """Check the base dimensions once before any test in this module.
+
+    pytest caches a module-scoped fixture's failure, so a broken value
+    errors every test here with one cause instead of each failing on its
+    own, while other test modules still run and report.
+    """
+    if MATERIAL_THICKNESS <= 0 or DRAWER_MATERIAL_THICKNESS <= 0:
+        pytest.fail("invalid config: material thickness must be positive", pytrace=False)
+    if min(SHELL["width"], SHELL["height"], SHELL["depth"]) <= 2 * DRAWER_MATERIAL_THICKNESS:
+        pytest.fail("invalid config: shell is not larger than twice the wall thickness", pytrace=False)
+
+
+class TestPositiveDimensions:
+    """Tests verifying every base dimension and clearance is positive."""
+
+    @pytest.mark.parametrize("name,value", [
+        ("DRAWER.width", DRAWER["width"]),
+        ("DRAWER.height", DRAWER["height"]),
+        ("DRAWER.depth", DRAWER["depth"]),
+        ("FLAT_LID_TAB_WIDTH", FLAT_LID_TAB_WIDTH),
+        ("FLAT_LID_TAB_DEPTH", FLAT_LID_TAB_DEPTH),
+        ("MATERIAL_THICKNESS", MATERIAL_THICKNESS),
+        ("DRAWER_MATERIAL_THICKNESS", DRAWER_MATERIAL_THICKNESS),
+        ("LID_TAB_CLEARANCE", LID_TAB_CLEARANCE),
+        ("DRAWER_CLEARANCE", DRAWER_CLEARANCE),
+    ])
+    def test_positive(self, name, value):
+        """Dimensions, thicknesses and clearances must be positive."""
+        assert value > 0, f"{name} must be positive"
+
 
 class TestDrawerFitsInShell:
     """Tests verifying drawers fit inside the outer shell with clearance."""
 
-    def test_drawer_width_fits_in_shell(self):
+    def test_drawer_width_fits_in_shell(self, dims):
         """Drawer width + walls + clearance must fit within shell's 6.5" side-to-side dimension."""
         # DRAWER["width"] (side-to-side) must fit in SHELL["depth"] (6.5" side-to-side)
-        shell_internal_side = SHELL["depth"] - (2 * DRAWER_MATERIAL_THICKNESS)
-        drawer_external_width = DRAWER["width"] + (2 * DRAWER_MATERIAL_THICKNESS)
-        required_clearance = 2 * DRAWER_CLEARANCE
+        shell_internal_side = dims.shell_internal_depth
+        drawer_external_width = dims.drawer_external_width
+        required_clearance = dims.required_clearance
 
         total_drawer_width_needed = drawer_external_width + required_clearance
         assert total_drawer_width_needed <= shell_internal_side, (
@@ -39,13 +78,12 @@ class TestDrawerFitsInShell:
             f"shell internal side ({shell_internal_side}mm)"
         )
 
-    def test_drawer_depth_fits_in_drawer_bay(self):
+    def test_drawer_depth_fits_in_drawer_bay(self, dims):
         """Drawer depth + walls must fit in drawer bay (along shell's 12" width dimension)."""
         # Drawer bay is along SHELL["width"] (12" front-to-back), not SHELL["depth"] (6.5" side-to-side)
-        shell_internal_length = SHELL["width"] - (2 * DRAWER_MATERIAL_THICKNESS)
-        drawer_bay_length = shell_internal_length - PAPER_COMPARTMENT_DEPTH - DRAWER_MATERIAL_THICKNESS
-        drawer_external_depth = DRAWER["depth"] + (2 * DRAWER_MATERIAL_THICKNESS)
-        required_clearance = 2 * DRAWER_CLEARANCE
+        drawer_bay_length = dims.drawer_bay_length
+        drawer_external_depth = dims.drawer_external_depth
+        required_clearance = dims.required_clearance
 
         total_drawer_depth_needed = drawer_external_depth + required_clearance
         assert total_drawer_depth_needed <= drawer_bay_length, (
@@ -54,11 +92,11 @@ class TestDrawerFitsInShell:
             f"drawer bay length ({drawer_bay_length}mm)"
         )
 
-    def test_drawer_height_fits_in_shell(self):
+    def test_drawer_height_fits_in_shell(self, dims):
         """Single drawer height + walls must allow at least one drawer to fit."""
-        shell_internal_height = SHELL["height"] - (2 * DRAWER_MATERIAL_THICKNESS)
-        drawer_external_height = DRAWER["height"] + DRAWER_MATERIAL_THICKNESS  # Bottom only
-        required_clearance = 2 * DRAWER_CLEARANCE
+        shell_internal_height = dims.shell_internal_height
+        drawer_external_height = dims.drawer_external_height
+        required_clearance = dims.required_clearance
 
         total_drawer_height_needed = drawer_external_height + required_clearance
         assert total_drawer_height_needed <= shell_internal_height, (
@@ -67,9 +105,9 @@ class TestDrawerFitsInShell:
             f"shell internal height ({shell_internal_height}mm)"
         )
 
-    def test_two_drawers_fit_vertically(self):
+    def test_two_drawers_fit_vertically(self, dims):
         """Two drawers stacked must fit in shell height."""
-        shell_internal_height = SHELL["height"] - (2 * DRAWER_MATERIAL_THICKNESS)
+        shell_internal_height = dims.shell_internal_height
         # Two drawer bottoms, middle shelf, clearance for each drawer
         drawer_stack_height = (
             2 * DRAWER["height"]  # Internal heights
@@ -87,11 +125,6 @@ class TestDrawerFitsInShell:
 class TestMaterialThicknessAccounting:
     """Tests verifying material thickness is properly accounted for."""
 
-    def test_material_thickness_positive(self):
-        """Material thickness must be positive."""
-        assert MATERIAL_THICKNESS > 0, "Material thickness must be positive"
-        assert DRAWER_MATERIAL_THICKNESS > 0, "Drawer material thickness must be positive"
-
     def test_drawer_material_reasonable(self):
         """Drawer material should be reasonable for laser cutting (1-6mm typical)."""
         assert 1.0 <= DRAWER_MATERIAL_THICKNESS <= 6.0, (
@@ -99,23 +132,19 @@ class TestMaterialThicknessAccounting:
             "outside typical laser cutting range (1-6mm)"
         )
 
-    def test_shell_external_greater_than_internal(self):
+    def test_shell_external_greater_than_internal(self, dims):
         """Shell external dimensions must exceed internal by 2x material thickness."""
-        expected_internal_width = SHELL["width"] - (2 * DRAWER_MATERIAL_THICKNESS)
-        expected_internal_height = SHELL["height"] - (2 * DRAWER_MATERIAL_THICKNESS)
-        expected_internal_depth = SHELL["depth"] - (2 * DRAWER_MATERIAL_THICKNESS)
-
-        assert expected_internal_width > 0, "Shell internal width must be positive"
-        assert expected_internal_height > 0, "Shell internal height must be positive"
-        assert expected_internal_depth > 0, "Shell internal depth must be positive"
+        assert dims.shell_internal_width > 0, "Shell internal width must be positive"
+        assert dims.shell_internal_height > 0, "Shell internal height must be positive"
+        assert dims.shell_internal_depth > 0, "Shell internal depth must be positive"
 
 
 class TestDividerAndShelfPositions:
     """Tests verifying divider and shelf positions account for material thickness."""
 
-    def test_paper_compartment_depth_reasonable(self):
+    def test_paper_compartment_depth_reasonable(self, dims):
         """Paper compartment must fit within shell and leave room for drawers."""
-        shell_internal_depth = SHELL["depth"] - (2 * DRAWER_MATERIAL_THICKNESS)
+        shell_internal_depth = dims.shell_internal_depth
 
         assert PAPER_COMPARTMENT_DEPTH > 0, "Paper compartment depth must be positive"
         assert PAPER_COMPARTMENT_DEPTH < shell_internal_depth, (
@@ -123,12 +152,11 @@ class TestDividerAndShelfPositions:
             f"shell internal depth ({shell_internal_depth}mm)"
         )
 
-    def test_divider_leaves_drawer_bay_space(self):
+    def test_divider_leaves_drawer_bay_space(self, dims):
         """Vertical divider position must leave enough space for drawer bay."""
         # Drawer bay is along SHELL["width"] (12" front-to-back), not SHELL["depth"] (6.5" side-to-side)
-        shell_internal_length = SHELL["width"] - (2 * DRAWER_MATERIAL_THICKNESS)
-        drawer_bay_length = shell_internal_length - PAPER_COMPARTMENT_DEPTH - DRAWER_MATERIAL_THICKNESS
-        min_drawer_depth = DRAWER["depth"] + (2 * DRAWER_CLEARANCE)
+        drawer_bay_length = dims.drawer_bay_length
+        min_drawer_depth = DRAWER["depth"] + dims.required_clearance
 
         assert drawer_bay_length >= min_drawer_depth, (
             f"Drawer bay length ({drawer_bay_length}mm) insufficient for "
@@ -153,20 +181,10 @@ class TestLidDimensions:
             f"groove depth ({LID_GROOVE_DEPTH}mm)"
         )
 
-    def test_lid_tab_clearance_positive(self):
-        """Lid tab clearance must be positive for insertion."""
-        assert LID_TAB_CLEARANCE > 0, "Lid tab clearance must be positive"
-
-    def test_flat_lid_tab_dimensions_positive(self):
-        """Flat lid tab dimensions must be positive."""
-        assert FLAT_LID_TAB_WIDTH > 0, "Flat lid tab width must be positive"
-        assert FLAT_LID_TAB_DEPTH > 0, "Flat lid tab depth must be positive"
-
-    def test_sliding_lid_fits_paper_compartment(self):
+    def test_sliding_lid_fits_paper_compartment(self, dims):
         """Sliding lid width must fit paper compartment."""
-        shell_internal_width = SHELL["width"] - (2 * DRAWER_MATERIAL_THICKNESS)
         # Lid sits in grooves, so it needs clearance
-        lid_width_with_tabs = shell_internal_width + (2 * SLIDING_LID_TAB_DEPTH)
+        lid_width_with_tabs = dims.shell_internal_width + (2 * SLIDING_LID_TAB_DEPTH)
 
         # The lid should be narrower than the total available space
         assert lid_width_with_tabs > 0, "Sliding lid width must be positive"
@@ -175,70 +193,39 @@ class TestLidDimensions:
 class TestTotalInternalSpace:
     """Tests verifying internal space equals external minus walls."""
 
-    def test_shell_internal_volume_calculation(self):
+    def test_shell_internal_volume_calculation(self, dims):
         """Internal volume should be calculable from external minus walls."""
         external_volume = SHELL["width"] * SHELL["height"] * SHELL["depth"]
-
-        internal_width = SHELL["width"] - (2 * DRAWER_MATERIAL_THICKNESS)
-        internal_height = SHELL["height"] - (2 * DRAWER_MATERIAL_THICKNESS)
-        internal_depth = SHELL["depth"] - (2 * DRAWER_MATERIAL_THICKNESS)
-        internal_volume = internal_width * internal_height * internal_depth
+        internal_volume = dims.shell_internal_width * dims.shell_internal_height * dims.shell_internal_depth
 
         assert internal_volume < external_volume, "Internal volume must be less than external"
         assert internal_volume > 0, "Internal volume must be positive"
 
-    def test_drawer_internal_dimensions_positive(self):
-        """All drawer internal dimensions must be positive."""
-        assert DRAWER["width"] > 0, "Drawer width must be positive"
-        assert DRAWER["height"] > 0, "Drawer height must be positive"
-        assert DRAWER["depth"] > 0, "Drawer depth must be positive"
-
 
 class TestFingerJointConsistency:
     """Tests for finger joint consistency between mating edges."""
 
     def test_material_thickness_allows_finger_joints(self):
         """Material must be thick enough for finger joints (minimum 2mm typical)."""
-        MIN_FINGER_JOINT_MATERIAL = 2.0
         assert DRAWER_MATERIAL_THICKNESS >= MIN_FINGER_JOINT_MATERIAL, (
             f"Material thickness ({DRAWER_MATERIAL_THICKNESS}mm) too thin "
             f"for finger joints (min {MIN_FINGER_JOINT_MATERIAL}mm)"
         )
 
-    def test_drawer_dimensions_allow_multiple_fingers(self):
-        """Drawer dimensions should allow for multiple finger joints."""
-        MIN_FINGER_SIZE = 5.0  # Typical minimum finger size
-        MIN_FINGERS = 3  # At least 3 fingers for strength
+    @pytest.mark.parametrize("name,dimensions", [("drawer", DRAWER), ("shell", SHELL)])
+    def test_dimensions_allow_multiple_fingers(self, name, dimensions):
+        """Drawer and shell dimensions should allow for multiple finger joints."""
+        min_dimension = min(dimensions["width"], dimensions["height"], dimensions["depth"])
 
-        min_dimension = min(DRAWER["width"], DRAWER["height"], DRAWER["depth"])
-        min_edge_for_fingers = MIN_FINGER_SIZE * MIN_FINGERS * 2  # Fingers + gaps
-
-        assert min_dimension >= min_edge_for_fingers, (
-            f"Smallest drawer dimension ({min_dimension}mm) too small "
-            f"for finger joints (need at least {min_edge_for_fingers}mm)"
-        )
-
-    def test_shell_dimensions_allow_multiple_fingers(self):
-        """Shell dimensions should allow for multiple finger joints."""
-        MIN_FINGER_SIZE = 5.0
-        MIN_FINGERS = 3
-
-        min_dimension = min(SHELL["width"], SHELL["height"], SHELL["depth"])
-        min_edge_for_fingers = MIN_FINGER_SIZE * MIN_FINGERS * 2
-
-        assert min_dimension >= min_edge_for_fingers, (
-            f"Smallest shell dimension ({min_dimension}mm) too small "
-            f"for finger joints (need at least {min_edge_for_fingers}mm)"
+        assert min_dimension >= MIN_EDGE_FOR_FINGERS, (
+            f"Smallest {name} dimension ({min_dimension}mm) too small "
+            f"for finger joints (need at least {MIN_EDGE_FOR_FINGERS}mm)"
         )
 
 
 class TestClearanceValues:
     """Tests verifying clearance values are reasonable."""
 
-    def test_drawer_clearance_positive(self):
-        """Drawer clearance must be positive for sliding."""
-        assert DRAWER_CLEARANCE > 0, "Drawer clearance must be positive"
-
     def test_drawer_clearance_reasonable(self):
         """Drawer clearance should be reasonable (0.5-3mm typical)."""
         assert 0.5 <= DRAWER_CLEARANCE <= 3.0, (
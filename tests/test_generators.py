@@ -0,0 +1,169 @@
+"""Render tests for the Boxes.py part generators.
+
+Skipped when Boxes.py is not installed.
+"""
+
+import re
+import xml.etree.ElementTree as ET
+
+import pytest
+
+pytest.importorskip("boxes")
+
+from faxbox.config import (  # noqa: E402
+    DRAWER,
+    ENGRAVE_FONT_SPACING,
+    INTERNAL_DEPTH,
+    LID_GROOVE_DEPTH,
+    PAPER_WIDTH,
+)
+from faxbox.generate_drawers import render_drawer  # noqa: E402
+from faxbox.generate_lids import render_lids  # noqa: E402
+from faxbox.shell_generator import PIXEL_FONT, _text_rects, render_shell  # noqa: E402
+
+# Outlines are offset by the burn correction, so sizes only match loosely
+SIZE_TOLERANCE = 1.0
+
+_RE_NUMBER = re.compile(r"-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?")
+_ENGRAVE_STROKES = {"rgb(255,0,0)", "#ff0000", "red"}
+
+
+def _paths(svg: bytes) -> list:
+    """All <path> elements of an SVG document, parsed with ElementTree."""
+    root = ET.fromstring(svg)
+    return [el for el in root.iter() if el.tag.rsplit("}", 1)[-1] == "path"]
+
+
+def _stroke(path) -> str:
+    """Stroke color of a path, from its attribute or its style."""
+    stroke = path.get("stroke")
+    if stroke is None:
+        style = dict(
+            item.split(":", 1) for item in path.get("style", "").split(";") if ":" in item
+        )
+        stroke = style.get("stroke", "")
+    return stroke.replace(" ", "").lower()
+
+
+def _subpaths(path) -> list[tuple[str, list[tuple[float, float]]]]:
+    """Split path data into (data, points) per M command."""
+    subpaths = []
+    for data in re.split(r"(?=M)", path.get("d", "")):
+        numbers = [float(n) for n in _RE_NUMBER.findall(data)]
+        if numbers:
+            subpaths.append((data.strip(), list(zip(numbers[::2], numbers[1::2]))))
+    return subpaths
+
+
+def _size(points: list[tuple[float, float]]) -> tuple[float, float]:
+    """Bounding box size of points, smaller side first."""
+    xs, ys = zip(*points)
+    return tuple(sorted((max(xs) - min(xs), max(ys) - min(ys))))
+
+
+def _matches(size: tuple[float, float], width: float, height: float) -> bool:
+    expected = sorted((width, height))
+    return all(abs(a - b) <= SIZE_TOLERANCE for a, b in zip(size, expected))
+
+
+def _is_closed(data: str, points: list[tuple[float, float]]) -> bool:
+    if data.rstrip().upper().endswith("Z"):
+        return True
+    (x0, y0), (x1, y1) = points[0], points[-1]
+    return abs(x0 - x1) < 1e-3 and abs(y0 - y1) < 1e-3
+
+
+@pytest.fixture(scope="module")
+def shell_svg(tmp_path_factory):
+    return render_shell(tmp_path_factory.mktemp("shell") / "shell.svg").getvalue()
+
+
+@pytest.fixture(scope="module")
+def lids_svg(tmp_path_factory):
+    return render_lids(tmp_path_factory.mktemp("lids") / "lids.svg").getvalue()
+
+
+@pytest.fixture(scope="module")
+def drawer_svg(tmp_path_factory):
+    return render_drawer(tmp_path_factory.mktemp("drawer") / "drawer.svg").getvalue()
+
+
+class TestRenders:
+    """Tests verifying every generator renders a usable SVG."""
+
+    @pytest.mark.parametrize("svg", ["shell_svg", "lids_svg", "drawer_svg"])
+    def test_renders_parseable_svg(self, svg, request):
+        data = request.getfixturevalue(svg)
+        root = ET.fromstring(data)
+        assert root.tag.rsplit("}", 1)[-1] == "svg"
+        assert _paths(data)
+
+
+class TestSlidingLid:
+    """Tests verifying the sliding lid is cut as one outline."""
+
+    def test_single_closed_outline(self, lids_svg):
+        tab_depth = LID_GROOVE_DEPTH - 1
+        width = PAPER_WIDTH - 0.5 + 2 * tab_depth
+        depth = INTERNAL_DEPTH - 0.5
+
+        outlines = [
+            (path, _subpaths(path))
+            for path in _paths(lids_svg)
+            if any(_matches(_size(points), width, depth) for _, points in _subpaths(path))
+        ]
+
+        assert len(outlines) == 1
+        _, subpaths = outlines[0]
+        assert len(subpaths) == 1
+        assert _is_closed(*subpaths[0])
+
+
+class TestFrontWall:
+    """Tests verifying the front wall openings and engraving."""
+
+    def test_drawer_openings_are_one_path(self, shell_svg):
+        openings = [
+            subpaths
+            for subpaths in map(_subpaths, _paths(shell_svg))
+            if subpaths
+            and all(
+                _matches(_size(points), DRAWER["width"], DRAWER["height"])
+                for _, points in subpaths
+            )
+        ]
+
+        assert len(openings) == 1
+        assert len(openings[0]) == 2
+
+    def test_engraving_is_one_path_of_rectangles(self, shell_svg):
+        engraving = [path for path in _paths(shell_svg) if _stroke(path) in _ENGRAVE_STROKES]
+
+        assert len(engraving) == 1
+        assert len(_subpaths(engraving[0])) == 160
+
+
+class TestTextRects:
+    """Tests verifying text layout against the per-pixel formula."""
+
+    def test_matches_per_pixel_formula(self):
+        ps = 3.0
+        cell = ps * 0.85
+        half = (ps - cell) / 2
+
+        expected = []
+        x = 0.0
+        for char in "FAX MACHINE":
+            pixels = PIXEL_FONT.get(char, [])
+            if not pixels:
+                x += ps * 3
+                continue
+            for col, row in pixels:
+                expected.append((x + col * ps + half, (6 - row) * ps + half, cell, cell))
+            x += ps * 5 + ENGRAVE_FONT_SPACING
+
+        rects, _ = _text_rects("FAX MACHINE", ps)
+
+        assert len(rects) == len(expected) == 160
+        flat = [value for rect in sorted(rects) for value in rect]
+        assert flat == pytest.approx([value for rect in sorted(expected) for value in rect])
@@ -0,0 +1,242 @@
+"""Tests for combining part SVGs into the final layout.
+
+These tests run on small hand-written SVGs in the boxes.py output format,
+so they do not need Boxes.py installed.
+"""
+
+import os
+import xml.etree.ElementTree as ET
+
+from faxbox.layout import (
+    _optimize_path_data,
+    convert_colors_to_ponoko,
+    create_layout_svg,
+    dedup_paths,
+    extract_svg_content,
+    parse_svg_dimensions,
+)
+
+PART_SVG = """<?xml version='1.0' encoding='utf-8'?>
+<svg height="50.0mm" viewBox="0.0 0.0 100.0 50.0" width="100.0mm" xmlns="http://www.w3.org/2000/svg">
+<!--
+Boxes.py part
+-->
+<title>Part</title>
+<metadata>
+<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#" xmlns:cc="http://creativecommons.org/ns#" xmlns:dc="http://purl.org/dc/elements/1.1/"><cc:Work><dc:title>Part</dc:title></cc:Work></rdf:RDF>
+</metadata>
+<g id="p-0" style="fill:none">
+<path d="M 10.0 10.0 L 90.0 10.0 L 90.0 40.0" stroke="rgb(0,0,0)" stroke-width="0.20"/>
+<path d="M 20.0 20.0 L 30.0 20.0" stroke="#000000" stroke-width="0.20"/>
+<path d="M 40.0 20.0 L 50.0 20.0" stroke="black" stroke-width="0.20"/>
+<path d="M 60.0 20.0 L 70.0 20.0" stroke="rgb(255,0,0)" stroke-width="0.20"/>
+</g>
+</svg>
+"""
+
+
+def write_part(tmp_path, content=PART_SVG, name="part.svg"):
+    """Write an SVG fixture to disk and return its path."""
+    svg_path = tmp_path / name
+    svg_path.write_text(content)
+    return svg_path
+
+
+class TestExtractSvgContent:
+    """Tests verifying part SVGs are cleaned up for embedding."""
+
+    def test_outer_svg_element_removed(self, tmp_path):
+        """Only the content inside the root <svg> element is kept."""
+        content = extract_svg_content(write_part(tmp_path))
+
+        assert "<?xml" not in content
+        assert "<svg" not in content
+        assert "</svg>" not in content
+        assert '<g id="p-0" style="fill:none">' in content
+
+    def test_metadata_title_and_comments_removed(self, tmp_path):
+        """Namespaced metadata, titles and comments are stripped."""
+        content = extract_svg_content(write_part(tmp_path))
+
+        assert "<metadata>" not in content
+        assert "rdf:" not in content
+        assert "<title>" not in content
+        assert "<!--" not in content
+
+    def test_black_strokes_become_blue(self, tmp_path):
+        """Black strokes are converted to Ponoko cut blue."""
+        content = extract_svg_content(write_part(tmp_path))
+
+        assert 'stroke="rgb(0,0,255)"' in content
+        assert content.count('stroke="#0000FF"') == 2
+        assert 'stroke="rgb(0,0,0)"' not in content
+        assert 'stroke="black"' not in content
+
+    def test_engrave_strokes_preserved(self, tmp_path):
+        """Red engrave strokes are left untouched."""
+        content = extract_svg_content(write_part(tmp_path))
+
+        assert 'stroke="rgb(255,0,0)"' in content
+
+    def test_axis_aligned_lines_compacted(self, tmp_path):
+        """Horizontal and vertical lines are written as H/V commands."""
+        content = extract_svg_content(write_part(tmp_path))
+
+        assert 'd="M 10.0 10.0 H 90.0 V 40.0"' in content
+
+    def test_burn_compensation_corner_preserved(self):
+        """Tiny burn-compensation corner curves keep their exact shape."""
+        d = "M 0.000 0.000 L 50.000 0.000 C 50.028 0.000 50.050 0.022 50.050 0.050 L 50.050 5.000 Z"
+        assert _optimize_path_data(d) == (
+            "M 0.000 0.000 H 50.000 C 50.028 0.000 50.050 0.022 50.050 0.050 V 5.000 Z"
+        )
+
+    def test_large_curve_preserved(self):
+        """Curves larger than the kerf keep their shape."""
+        d = "M 0.000 0.000 C 5.000 0.000 10.000 5.000 10.000 10.000"
+        assert _optimize_path_data(d) == d
+
+    def test_unsupported_path_data_untouched(self):
+        """Relative or arc commands are left as-is."""
+        d = "M 0 0 l 10 0 a 5 5 0 0 1 5 5"
+        assert _optimize_path_data(d) == d
+
+    def test_str_path(self, tmp_path):
+        """File paths may be given as plain strings."""
+        svg_path = write_part(tmp_path)
+        assert extract_svg_content(str(svg_path)) == extract_svg_content(svg_path)
+
+    def test_in_memory_svg_data(self, tmp_path):
+        """SVG data rendered in memory is cleaned up like a file."""
+        assert extract_svg_content(PART_SVG.encode()) == extract_svg_content(write_part(tmp_path))
+
+    def test_cache_invalidated_when_file_changes(self, tmp_path):
+        """Rewriting a part SVG is picked up on the next extraction."""
+        svg_path = write_part(tmp_path)
+        assert 'stroke="rgb(255,0,0)"' in extract_svg_content(svg_path)
+
+        # Same modification time, as for a rewrite within one timestamp tick
+        stat = svg_path.stat()
+        svg_path.write_text(PART_SVG.replace("rgb(255,0,0)", "#FF0000"))
+        os.utime(svg_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        content = extract_svg_content(svg_path)
+        assert 'stroke="rgb(255,0,0)"' not in content
+        assert 'stroke="#FF0000"' in content
+
+
+class TestConvertColorsToPonoko:
+    """Tests verifying standalone stroke recoloring."""
+
+    def test_matches_extraction_cleanup(self):
+        """Recoloring text gives the same strokes as extracting a part."""
+        content = convert_colors_to_ponoko(PART_SVG)
+
+        assert content.count('stroke="rgb(0,0,255)"') == 1
+        assert content.count('stroke="#0000FF"') == 2
+        assert 'stroke="rgb(255,0,0)"' in content
+
+
+class TestParseSvgDimensions:
+    """Tests verifying part dimensions are read from the root element."""
+
+    def test_viewbox_dimensions(self, tmp_path):
+        """Width and height come from the viewBox."""
+        assert parse_svg_dimensions(write_part(tmp_path)) == (100.0, 50.0)
+
+    def test_width_height_fallback(self, tmp_path):
+        """Without a viewBox, the mm width/height attributes are used."""
+        svg_path = write_part(tmp_path, PART_SVG.replace(' viewBox="0.0 0.0 100.0 50.0"', ""))
+        assert parse_svg_dimensions(svg_path) == (100.0, 50.0)
+
+    def test_str_path(self, tmp_path):
+        """File paths may be given as plain strings."""
+        assert parse_svg_dimensions(str(write_part(tmp_path))) == (100.0, 50.0)
+
+    def test_in_memory_svg_data(self):
+        """Dimensions are read from SVG data rendered in memory."""
+        assert parse_svg_dimensions(PART_SVG.encode()) == (100.0, 50.0)
+
+    def test_root_tag_beyond_file_head(self, tmp_path):
+        """A root tag pushed past the head of the file is still found."""
+        padding = "<!-- " + "x" * 4096 + " -->\n"
+        svg_path = write_part(tmp_path, PART_SVG.replace("<svg ", padding + "<svg ", 1))
+        assert parse_svg_dimensions(svg_path) == (100.0, 50.0)
+
+
+class TestCreateLayoutSvg:
+    """Tests verifying the combined layout SVG."""
+
+    def build_layout(self, tmp_path, **kwargs):
+        """Combine three copies of the fixture part into a layout."""
+        shell_svg = write_part(tmp_path, name="outer_shell.svg")
+        drawer_svg = write_part(tmp_path, PART_SVG.replace("p-0", "drawer-0"), name="drawer.svg")
+        lids_svg = write_part(tmp_path, name="lids.svg")
+        output_path = tmp_path / "final_layout.svg"
+        create_layout_svg(shell_svg, drawer_svg, lids_svg, output_path, **kwargs)
+        return output_path.read_text()
+
+    def test_layout_is_well_formed(self, tmp_path):
+        """The combined layout parses as XML."""
+        ET.fromstring(self.build_layout(tmp_path).encode())
+
+    def test_drawers_inline_by_default(self, tmp_path):
+        """Each drawer gets its own copy of the geometry, without <use>."""
+        layout = self.build_layout(tmp_path)
+
+        assert layout.count('<g id="drawer-0"') == 2
+        assert '<g id="drawer-1"' in layout
+        assert '<g id="drawer-2"' in layout
+        assert "<use" not in layout
+        assert "<defs>" not in layout
+
+    def test_drawer_geometry_emitted_once(self, tmp_path):
+        """With instance_drawers, both drawers reference one shared drawer definition."""
+        layout = self.build_layout(tmp_path, instance_drawers=True)
+
+        assert layout.count('<g id="drawer-0"') == 1
+        assert layout.count('xlink:href="#drawer-template"') == 2
+
+    def test_paths_not_shared_by_default(self, tmp_path):
+        """Each part keeps its own path elements unless sharing is requested."""
+        layout = self.build_layout(tmp_path)
+
+        assert layout.count("<path ") == 16
+        assert 'xlink:href="#path-' not in layout
+
+    def test_shared_paths_emitted_once(self, tmp_path):
+        """With share_paths, identical paths in different parts become <use> references."""
+        layout = self.build_layout(tmp_path, share_paths=True)
+
+        assert layout.count("<path ") == 4
+        assert layout.count('<use xlink:href="#path-') == 12
+
+
+class TestDedupPaths:
+    """Tests verifying repeated path elements are shared."""
+
+    def test_unique_paths_unchanged(self):
+        """Paths that occur once are left without ids."""
+        contents = ['<path d="M 0 0 H 1" stroke="#0000FF"/>', '<path d="M 0 0 H 2" stroke="#0000FF"/>']
+        assert dedup_paths(contents) == contents
+
+    def test_repeated_path_referenced(self):
+        """The repeat keeps its attributes via the referenced element."""
+        path = '<path d="M 0 0 H 1" stroke="#0000FF" stroke-width="0.20"/>'
+        first, second = dedup_paths([path, path])
+
+        assert first == '<path id="path-0" d="M 0 0 H 1" stroke="#0000FF" stroke-width="0.20"/>'
+        assert second == '<use xlink:href="#path-0"/>'
+
+    def test_paths_with_id_left_alone(self):
+        """Paths with their own id are not referenced; data-id doesn't count."""
+        with_id = '<path id="keep" d="M 0 0 H 1"/>'
+        with_data_id = '<path data-id="x" d="M 0 0 H 1"/>'
+
+        assert dedup_paths([with_id, with_id]) == [with_id, with_id]
+        assert dedup_paths([with_data_id, with_data_id])[1] == '<use xlink:href="#path-0"/>'
+
+    def test_differently_styled_paths_kept(self):
+        """Same geometry with a different stroke is not merged."""
+        contents = ['<path d="M 0 0 H 1" stroke="#0000FF"/>', '<path d="M 0 0 H 1" stroke="rgb(255,0,0)"/>']
+        assert dedup_paths(contents) == contents